@@ -64,7 +64,7 @@ class SourceController:
         if text == '':
             return True
 
-        re_match = re.search(patterns.VERSION_WHITELIST, text)
+        re_match = patterns.VERSION_WHITELIST.search(text)
         if re_match is None:
             return True
         return False
@@ -447,7 +447,10 @@ class ETRMConnection:
 
         statewide_id = sanitizers.sanitize_statewide_id(statewide_id)
         url = f'/measures/{statewide_id}/{version}/permutations'
-        permutations_table: PermutationsTable | None = None
+        # page rows are collected and the table is built once, rather
+        # than re-copying the accumulated rows for every page
+        headers: list[str] | None = None
+        results: list[list[Any]] = []
         while url is not None:
             response = self.get(url, stream=False)
             response_json: dict[str, Any] = response.json()
@@ -466,12 +469,24 @@ class ETRMConnection:
                 if prev_offset == url_offset:
                     break
 
-            table = PermutationsTable(response.json())
-            if permutations_table is None:
-                permutations_table = table
-            else:
-                permutations_table.join(table)
+            page_results = response_json.get('results', [])
+            if not isinstance(page_results, list):
+                raise ETRMResponseError()
+
+            if headers is None:
+                headers = response_json.get('headers', [])
+            elif (page_results != []
+                    and response_json.get('headers') != headers):
+                raise ETRMResponseError()
 
+            results.extend(page_results)
             url = next_url
 
-        return permutations_table
+        if headers is None:
+            return None
+
+        return PermutationsTable({
+            'count': len(results),
+            'headers': headers,
+            'results': results
+        })
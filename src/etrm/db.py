@@ -1,6 +1,8 @@
 import itertools
 import sqlite3 as sql
 import pylightxl as xl
+from collections import defaultdict
+from functools import lru_cache
 from typing import (
     Any,
     Optional,
@@ -617,7 +619,10 @@ def get_permutation_data(reporting_name: str) -> dict[str, str] | None:
     }
 
 
-def get_permutation_names() -> list[str]:
+# the permutation and characterization names are static, so the
+# results are cached and returned as tuples to keep them immutable
+@lru_cache
+def get_permutation_names() -> tuple[str, ...]:
     query = (
         'SELECT reporting_name'
         ' FROM permutation_names'
@@ -625,11 +630,12 @@ def get_permutation_names() -> list[str]:
     with _DB as cursor:
         response = cursor.execute(query).fetchall()
 
-    return listify(response)
+    return tuple(listify(response))
 
 
+@lru_cache
 def get_all_characterization_names(source: Literal['json', 'etrm']
-                                  ) -> list[str]:
+                                  ) -> tuple[str, ...]:
     query = (
         'SELECT name'
         ' FROM characterizations'
@@ -638,7 +644,7 @@ def get_all_characterization_names(source: Literal['json', 'etrm']
     with _DB as cursor:
         response = cursor.execute(query).fetchall()
 
-    return listify(response)
+    return tuple(listify(response))
 
 
 # returns a list of characterization names that have mapped values
@@ -821,18 +827,15 @@ def get_exclusion_map(key_name: str,
         finally:
             cursor.close()
 
-    exclusions: dict[str, set[str]] = {}
+    exclusions: defaultdict[str, set[str]] = defaultdict(set)
     for label_join, value_join in response:
         labels = str(label_join).split(';;')
         values = str(value_join).split(';;')
         key_index = labels.index(key_name)
         mapped_index = labels.index(mapped_name)
-        try:
-            exclusions[values[key_index]].add(values[mapped_index])
-        except KeyError:
-            exclusions[values[key_index]] = {values[mapped_index]}
+        exclusions[values[key_index]].add(values[mapped_index])
 
-    return exclusions
+    return dict(exclusions)
 
 
 def get_all_exclusions(*permutations: str,
@@ -1363,17 +1366,18 @@ def __insert_exclusions() -> None:
 
         for value in values:
             value = str(value)
-            if 'NOT ALLOWED' in value.upper() or 'REMOVE' in value.upper():
+            upper_value = value.upper()
+            if 'NOT ALLOWED' in upper_value or 'REMOVE' in upper_value:
                 allowed = 1
             else:
                 allowed = 0
 
             match label:
                 case 'Program Administrator Type;;Program Administrator':
-                    if any([_value == '' for _value in value.split(';;')]):
+                    if any(_value == '' for _value in value.split(';;')):
                         continue
                 case _:
-                    if all([_value == '' for _value in value.split(';;')]):
+                    if all(_value == '' for _value in value.split(';;')):
                         break
 
             exclusions.append((label, value, allowed))
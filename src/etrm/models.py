@@ -1,12 +1,21 @@
 from __future__ import annotations
 import os
-import csv
-import math
+import stat
 import datetime as dt
-import statistics as st
 import unicodedata as ud
-from typing import Literal, Any, overload
-from pandas import DataFrame, Series
+import numpy as np
+from typing import Literal, Any, Sequence, overload
+from operator import attrgetter
+from functools import cached_property
+from pandas import (
+    DataFrame,
+    Series,
+    Index,
+    read_csv,
+    concat,
+    to_numeric
+)
+from pandas.errors import EmptyDataError
 
 from src.etrm import utils, _constants as cnst
 from src.utils import getc, JSONObject
@@ -20,6 +29,19 @@ from src.etrm.exceptions import (
 
 ETRM_URL = 'https://www.caetrm.com'
 
+_NONRES_DEFAULTS = frozenset({
+    'Com-Default>2yrs',
+    'Ind-Default>2yrs',
+    'Agric-Default>2yrs'
+})
+"""Non-residential sector default NTG IDs."""
+
+_NTG_VERSION_EXEMPT = _NONRES_DEFAULTS | {'Res-Default>2yrs'}
+"""Sector default NTG IDs, which do not require an NTG version."""
+
+_DEEMED_PAIR = frozenset({'DnDeemed', 'UpDeemed'})
+"""Delivery types that together mark a measure as deemed."""
+
 
 class PermutationsTable:
     reporting_baselines = {
@@ -44,6 +66,9 @@ class PermutationsTable:
         'MTC_2': 'Measure Total Cost 2nd Baseline'
     }
 
+    csv_chunk_size = 50_000
+    """Maximum number of rows parsed at a time when reading a CSV file."""
+
     @overload
     def __init__(self, csv_path: str):
         ...
@@ -64,17 +89,19 @@ class PermutationsTable:
                 f' input of type {type(_input)}'
             )
 
-        self.count = len(self._results)
-        self.data = DataFrame(
-            data=self._results,
-            columns=self.headers
-        )
-
-        columns = [list(col) for col in zip(*self._results)]
-        data: dict[str, list[str | float | None]] = {}
-        for x, header in enumerate(self.headers):
-            data[header] = columns[x]
-        self.data = DataFrame(data)
+    @property
+    def data(self) -> DataFrame:
+        return self.__data
+
+    @data.setter
+    def data(self, data: DataFrame) -> None:
+        self.__data = data
+        self.__baseline_totals: (
+            tuple[dict[str, np.ndarray], dict[str, np.ndarray], np.ndarray]
+                | None
+        ) = None
+        self.__mat_codes: tuple[np.ndarray, Index] | None = None
+        self.__mat_groups: dict[tuple[tuple[str, ...], bool], np.ndarray] = {}
 
     def __getitem__(self, header: str) -> Series:
         try:
@@ -85,50 +112,73 @@ class PermutationsTable:
             ) from err
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, PermutationsTable):
             return False
 
-        return self.__dict__ == other.__dict__
+        return (
+            self.source == other.source
+                and self.count == other.count
+                and self.headers == other.headers
+                and self.data.equals(other.data)
+        )
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
     def __csv_init(self, csv_path: str) -> None:
-        if not os.path.exists(csv_path):
+        try:
+            mode = os.stat(csv_path).st_mode
+        except FileNotFoundError as err:
             raise ETRMConnectionError(
                 f'Invalid file path: {csv_path} does not exist'
-            )
+            ) from err
+        except OSError as err:
+            raise ETRMConnectionError(
+                f'Invalid file path: {csv_path} cannot be accessed'
+            ) from err
 
-        if not os.path.isfile(csv_path):
+        if not stat.S_ISREG(mode):
             raise ETRMConnectionError(
                 f'Invalid file path: {csv_path} is a folder, not a csv file'
             )
 
         _, ext = os.path.splitext(csv_path)
-        if not ext == '.csv':
+        if ext.lower() != '.csv':
             raise ETRMConnectionError(
                 f'Invalid file path: {csv_path} is a {ext} file, not a csv'
                 ' file'
             )
 
-        self.headers: list[str] = []
-        self._results: list[list[str]] = []
-        with open(csv_path) as fp:
-            csv_reader = csv.reader(fp)
-            self.headers.extend(next(csv_reader))
-            for line in csv_reader:
-                self._results.append(line)
+        try:
+            reader = read_csv(
+                csv_path,
+                dtype=str,
+                keep_default_na=False,
+                chunksize=self.csv_chunk_size
+            )
+        except EmptyDataError as err:
+            raise ETRMConnectionError(
+                f'Invalid file path: {csv_path} is an empty csv file'
+            ) from err
+
+        with reader:
+            self.data = concat(reader, ignore_index=True)
+
+        self.headers: list[str] = self.data.columns.tolist()
+        self.count = len(self.data)
 
         self.baselines = self.verbose_baselines
         self.columns = cnst.verbose
         self.source = 'csv'
 
     def __json_init(self, _json: dict[str, Any]) -> None:
-        self.json = _json
         try:
             self.count = getc(_json, 'count', int)
             self.headers = getc(_json, 'headers', list[str])
-            self._results = getc(
+            results = getc(
                 _json,
                 'results',
                 list[list[str | float | None]]
@@ -136,18 +186,149 @@ class PermutationsTable:
         except IndexError:
             raise ETRMResponseError()
 
+        self.count = len(results)
+        self.data = DataFrame(results, columns=self.headers)
+
         self.baselines = self.reporting_baselines
         self.columns = cnst.reporting
         self.source = 'etrm'
 
-    def join(self, table: PermutationsTable) -> None:
-        if table.count == 0:
+    def join(self, *tables: PermutationsTable) -> None:
+        """Appends the rows of each table in `tables` to this table.
+
+        All rows are concatenated at once, so joining many pages does
+        not copy the accumulated rows once per page.
+        """
+
+        frames = [self.data] if self.count != 0 else []
+        for table in tables:
+            if table.count == 0:
+                continue
+
+            if not self.data.columns.equals(table.data.columns):
+                raise ETRMResponseError()
+
+            frames.append(table.data)
+
+        if len(frames) < 2:
+            if frames != [] and frames[0] is not self.data:
+                self.data = frames[0].copy()
+                self.count = len(self.data)
             return
 
-        if self.headers != table.headers:
-            raise ETRMResponseError()
+        # columns with mismatched dtypes (e.g., an all-None page) are
+        # concatenated as objects, then re-inferred as a whole
+        dtypes = frames[0].dtypes
+        mismatched = [
+            column for i, column in enumerate(self.data.columns)
+                if any(frame.dtypes.iat[i] != dtypes.iat[i]
+                       for frame in frames[1:])
+        ]
+        if mismatched != []:
+            casts = dict.fromkeys(mismatched, object)
+            frames = [frame.astype(casts) for frame in frames]
+
+        data = concat(frames, ignore_index=True)
+        if mismatched != []:
+            data = data.astype(data[mismatched].infer_objects().dtypes)
+
+        self.data = data
+        self.count = len(self.data)
+
+    def __get_mat_codes(self) -> tuple[np.ndarray, Index]:
+        """Returns the integer codes and unique labels of the measure
+        application type column.
+
+        Blank (`None`) types are given their own code. The codes are
+        cached until `data` is reassigned.
+        """
+
+        if self.__mat_codes is None:
+            mat_col = self.data[self.columns.MEASURE_APPLICATION_TYPE]
+            self.__mat_codes = mat_col.factorize(use_na_sentinel=False)
+        return self.__mat_codes
+
+    def __get_baseline_totals(self) -> tuple[dict[str, np.ndarray],
+                                             dict[str, np.ndarray],
+                                             np.ndarray]:
+        """Returns a three-tuple of the (baseline sums, baseline non-null
+        counts, row counts) of each measure application type, indexed by
+        the measure application type codes.
+
+        Each baseline column is reduced with `np.bincount` over the cached
+        measure application type codes. The totals are cached until `data`
+        is reassigned.
+        """
+
+        if self.__baseline_totals is None:
+            codes, labels = self.__get_mat_codes()
+            size = len(labels)
+            sums: dict[str, np.ndarray] = {}
+            counts: dict[str, np.ndarray] = {}
+            for column in self.baselines.values():
+                if column not in self.data.columns:
+                    continue
 
-        self._results.extend(table._results)
+                values = to_numeric(
+                    self.data[column],
+                    errors='coerce'
+                ).to_numpy(dtype=np.float64)
+                valid = ~np.isnan(values)
+                sums[column] = np.bincount(
+                    codes,
+                    weights=np.where(valid, values, 0),
+                    minlength=size
+                )
+                counts[column] = np.bincount(
+                    codes,
+                    weights=valid,
+                    minlength=size
+                ).astype(np.int64)
+
+            self.__baseline_totals = (
+                sums,
+                counts,
+                np.bincount(codes, minlength=size)
+            )
+        return self.__baseline_totals
+
+    def get_mat_mask(self, *mat_labels: str) -> Series:
+        """Returns a boolean mask of the rows whose measure application
+        type is in `mat_labels`.
+
+        Each mask is an integer comparison against the label codes rather
+        than a string comparison against every row.
+        """
+
+        codes, labels = self.__get_mat_codes()
+        label_codes = np.flatnonzero(labels.isin(mat_labels))
+        return Series(np.isin(codes, label_codes), index=self.data.index)
+
+    def __get_mat_groups(self,
+                         mat_labels: tuple[str, ...],
+                         negate: bool
+                        ) -> np.ndarray:
+        """Returns a boolean mask of the measure application type codes
+        selected by `mat_labels`.
+
+        The cost methods request the same few selections repeatedly, so
+        each mask is cached by its sorted labels until `data` is
+        reassigned.
+        """
+
+        key = (tuple(sorted(mat_labels)), negate)
+        groups = self.__mat_groups.get(key)
+        if groups is None:
+            _, labels = self.__get_mat_codes()
+            if mat_labels != ():
+                groups = labels.isin(mat_labels)
+                if negate:
+                    groups = ~groups
+            else:
+                groups = np.ones(len(labels), dtype=bool)
+
+            self.__mat_groups[key] = groups
+        return groups
 
     def get_baseline_avg(self,
                          baseline: str,
@@ -158,82 +339,53 @@ class PermutationsTable:
         if column is None:
             raise ETRMError(f'Unknown baseline: {baseline}')
 
-        if mat_labels != ():
-            if negate:
-                df = self.data.loc[
-                    ~self.data['MeasAppType'].isin([*mat_labels])
-                ]
-            else:
-                df = self.data.loc[
-                    self.data['MeasAppType'].isin([*mat_labels])
-                ]
-        else:
-            df = self.data
-
-        if df.empty:
+        sums, counts, sizes = self.__get_baseline_totals()
+        groups = self.__get_mat_groups(mat_labels, negate)
+        if sizes[groups].sum() == 0:
             return None
 
-        avg = df[column].mean()
-        if math.isnan(avg):
+        count = counts[column][groups].sum()
+        if count == 0:
             return 0
 
-        return avg
+        return sums[column][groups].sum() / count
 
-    def get_standard_costs(self) -> tuple[float, float, float]:
-        """Returns a three-tuple of the (Peak Electric Demand Reduction,
-        Electric Savings, Gas Savings) standard costs.
+    def __get_standard_avg(self, first: str, second: str) -> float:
+        """Returns the average of the `first` baseline (NC or NR) and
+        `second` baseline (AR) averages.
 
-        The standard costs are either:
-            First Baseline  (NC or NR)
-            Second Baseline (AR)
-            None            (other)
+        Baselines without any matching permutations are excluded.
         """
 
-        pedr_vals: list[float] = []
-        pedr = self.get_baseline_avg('PEDR_1', 'NC', 'NR')
-        if pedr is not None:
-            pedr_vals.append(pedr)
-
-        pedr = self.get_baseline_avg('PEDR_2', 'AR')
-        if pedr is not None:
-            pedr_vals.append(pedr)
+        first_avg = self.get_baseline_avg(first, 'NC', 'NR')
+        second_avg = self.get_baseline_avg(second, 'AR')
 
-        if len(pedr_vals) == 0:
-            pedr = 0.0
-        else:
-            pedr = st.fmean(pedr_vals)
-
-        es_vals: list[float] = []
-        es = self.get_baseline_avg('ES_1', 'NC', 'NR')
-        if es is not None:
-            es_vals.append(es)
+        if first_avg is None and second_avg is None:
+            return 0.0
 
-        es = self.get_baseline_avg('ES_2', 'AR')
-        if es is not None:
-            es_vals.append(es)
+        if first_avg is None:
+            return float(second_avg)
 
-        if len(es_vals) == 0:
-            es = 0.0
-        else:
-            es = st.fmean(es_vals)
+        if second_avg is None:
+            return float(first_avg)
 
-        gs_vals: list[float] = []
-        gs = self.get_baseline_avg('GS_1', 'NC', 'NR')
-        if gs is not None:
-            gs_vals.append(gs)
+        return (first_avg + second_avg) / 2
 
-        gs = self.get_baseline_avg('GS_2', 'AR')
-        if gs is not None:
-            gs_vals.append(gs)
+    def get_standard_costs(self) -> tuple[float, float, float]:
+        """Returns a three-tuple of the (Peak Electric Demand Reduction,
+        Electric Savings, Gas Savings) standard costs.
 
-        if len(gs_vals) == 0:
-            gs = 0.0
-        else:
-            gs = st.fmean(gs_vals)
+        The standard costs are either:
+            First Baseline  (NC or NR)
+            Second Baseline (AR)
+            None            (other)
+        """
 
+        pedr = self.__get_standard_avg('PEDR_1', 'PEDR_2')
+        es = self.__get_standard_avg('ES_1', 'ES_2')
+        gs = self.__get_standard_avg('GS_1', 'GS_2')
         return (pedr, es, gs)
 
-
     def get_pre_existing_costs(self) -> tuple[float, float, float]:
         """Returns a three-tuple of the (Peak Electric Demand Reduction,
         Electric Savings, Gas Savings) pre-existing costs.
@@ -257,19 +409,7 @@ class PermutationsTable:
             None                            (other)
         """
 
-        mtc_1 = self.get_baseline_avg('MTC_1', 'NC', 'NR')
-        mtc_2 = self.get_baseline_avg('MTC_2', 'AR')
-
-        if mtc_1 is None and mtc_2 is None:
-            return 0.0
-
-        if mtc_1 is None:
-            return mtc_2
-
-        if mtc_2 is None:
-            return mtc_1
-
-        return st.fmean([mtc_1, mtc_2])
+        return self.__get_standard_avg('MTC_1', 'MTC_2')
 
     def get_total_cost(self) -> float:
         """Returns the total cost of the measure.
@@ -283,6 +423,9 @@ class PermutationsTable:
 
 
 class MeasureInfo:
+    __slots__ = ('name', 'url')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -291,16 +434,22 @@ class MeasureInfo:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, MeasureInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class MeasuresResponse:
+    __slots__ = ('count', 'next', 'previous', 'results')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.count = getc(res_json, 'count', int)
@@ -311,16 +460,23 @@ class MeasuresResponse:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, MeasuresResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class MeasureVersionInfo:
+    __slots__ = ('version', 'status', 'change_description', 'owner',
+                 'is_published', 'date_committed', 'url')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.version = getc(res_json, 'version', str)
@@ -334,16 +490,22 @@ class MeasureVersionInfo:
             raise ETRMResponseError('malformed measure version info')
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, MeasureVersionInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class MeasureVersionsResponse:
+    __slots__ = ('statewide_measure_id', 'use_category', 'versions')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.statewide_measure_id = getc(res_json,
@@ -357,16 +519,24 @@ class MeasureVersionsResponse:
             raise ETRMResponseError('malformed measure versions response')
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, MeasureVersionsResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class Reference:
+    __slots__ = ('json', 'reference_code', 'reference_citation',
+                 'source_reference', 'source_url', 'reference_location',
+                 'reference_type', 'publication_title', 'lead_author',
+                 'lead_author_org', 'sponsor_org', 'source_document')
+
     def __init__(self, res_json: dict[str, Any]):
         self.json = res_json
         try:
@@ -401,18 +571,26 @@ class Reference:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Reference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.reference_code == other.reference_code
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        return hash(self.reference_code)
+
 
 class Permutation:
     """Class representation of a measure permutation."""
 
+    __slots__ = ('reporting_name', 'mapped_name', 'derivation')
+
     def __init__(self,
                  reporting_name: str,
                  mapped_name: str | None,
@@ -425,34 +603,49 @@ class Permutation:
 class Characterization:
     """Class representation of a characterization."""
 
+    __slots__ = ('name', 'content')
+
     def __init__(self, name: str, content: str):
         self.name = name
         self.content = content
 
 
 class Version:
+    __slots__ = ('table_name', 'version')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             version_string = getc(res_json, 'version_string', str)
         except IndexError:
             raise ETRMResponseError()
-        try:
-            self.table_name, self.version = version_string.split('-', 1)
-        except ValueError:
+
+        table_name, sep, version = version_string.partition('-')
+        if not sep:
             raise ETRMResponseError(f'{version_string} is not'
                                     ' properly formatted')
 
+        self.table_name = table_name
+        self.version = version
+
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Version):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class SharedDeterminantRef:
+    __slots__ = ('order', 'name', 'version', 'active_labels',
+                 'active_label_set', 'url')
+    __key = attrgetter('order', 'name', 'version', 'active_labels', 'url')
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.order = getc(res_json, 'order', int)
@@ -464,17 +657,25 @@ class SharedDeterminantRef:
         except IndexError:
             raise ETRMResponseError()
 
+        self.active_label_set = frozenset(self.active_labels)
+
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SharedDeterminantRef):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class Label:
+    __slots__ = ('name', 'api_name', 'active', 'description')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -485,16 +686,23 @@ class Label:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Label):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class Determinant:
+    __slots__ = ('name', 'api_name', 'labels', 'description', 'order',
+                 'reference_refs')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -507,16 +715,22 @@ class Determinant:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Determinant):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class SharedLookupRef:
+    __slots__ = ('order', 'name', 'version', 'url')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.order = getc(res_json, 'order', int)
@@ -528,16 +742,22 @@ class SharedLookupRef:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SharedLookupRef):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class Column:
+    __slots__ = ('name', 'api_name', 'unit', 'reference_refs')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -553,16 +773,24 @@ class Column:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Column):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class ValueTable:
+    __slots__ = ('name', 'api_name', 'type', 'description', 'order',
+                 'determinants', 'columns', 'values', 'reference_refs',
+                 '_column_map')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -577,26 +805,29 @@ class ValueTable:
         except IndexError:
             raise ETRMResponseError()
 
+        # reversed so that the first column with a given API name is kept
+        self._column_map: dict[str, Column] = {
+            column.api_name.lower(): column
+                for column in reversed(self.columns)
+        }
+
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ValueTable):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
     def get_column(self, api_name: str) -> Column | None:
-        for column in self.columns:
-            if column.api_name.lower() == api_name.lower():
-                return column
-        return None
+        return self._column_map.get(api_name.lower())
 
     def contains_column(self, api_name: str) -> bool:
-        for column in self.columns:
-            if column.api_name.lower() == api_name.lower():
-                return True
-        return False
+        return api_name.lower() in self._column_map
 
 
 class SharedValueTable:
@@ -629,28 +860,41 @@ class SharedValueTable:
 
             self.data: dict[str, dict[str, list[str | float | None]]] = {}
             for row in self.values:
-                eul_id = str(row[0])
-                id_map = self.data.get(eul_id, {})
-                for i, item in enumerate(row[1:], 1):
-                    mapped_list = id_map.get(headers[i], [])
-                    mapped_list.append(item)
-                    id_map[headers[i]] = mapped_list
-                self.data[eul_id] = id_map
+                if len(row) > len(headers):
+                    raise IndexError('malformed shared value table row')
+
+                # rows may be ragged, so only the cells present are mapped
+                id_map = self.data.setdefault(str(row[0]), {})
+                for header, item in zip(headers[1:], row[1:]):
+                    id_map.setdefault(header, []).append(item)
 
         except IndexError:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SharedValueTable):
             return False
 
-        return self.__dict__ == other.__dict__
+        return (
+            self.api_name == other.api_name
+                and self.version == other.version
+        )
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        return hash((self.api_name, self.version))
+
 
 class Calculation:
+    __slots__ = ('name', 'api_name', 'order', 'unit', 'determinants', 'values',
+                 'reference_refs')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -664,16 +908,23 @@ class Calculation:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Calculation):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
 
 class ExclusionTable:
+    __slots__ = ('name', 'api_name', 'order', 'determinants', 'values',
+                 'reference_refs')
+    __key = attrgetter(*__slots__)
+
     def __init__(self, res_json: dict[str, Any]):
         try:
             self.name = getc(res_json, 'name', str)
@@ -686,10 +937,13 @@ class ExclusionTable:
             raise ETRMResponseError()
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ExclusionTable):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__key(self) == self.__key(other)
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
@@ -699,8 +953,8 @@ class Measure(JSONObject):
     def __init__(self,
                  res_json: dict[str, Any],
                  source: Literal['etrm', 'json'],
-                 char_names: list[str],
-                 perm_names: list[str] | None=None):
+                 char_names: Sequence[str],
+                 perm_names: Sequence[str] | None=None):
         """Initializes a new eTRM measure object.
 
         Measures can be generated from two sources:
@@ -713,6 +967,9 @@ class Measure(JSONObject):
         If the measure is generated from an eTRM API response:
             - The measure object will not contain any permutation mappings.
             Instead, permutations must be acquired from another eTRM API call.
+
+        Characterizations and permutation mappings are built on first
+        access.
         """
 
         JSONObject.__init__(self, res_json)
@@ -747,58 +1004,24 @@ class Measure(JSONObject):
         id_path = '/'.join(self.version_id.split('-'))
         self.link = f'{ETRM_URL}/measure/{id_path}'
 
-        self.characterizations = self.__get_characterizations(char_names)
-        self.permutations = self.__get_permutations(perm_names or [])
-
-        self._determinant_map: dict[str, Determinant] = {}
-        for determinant in self.determinants:
-            self._determinant_map[determinant.api_name.lower()] = determinant
-            self._determinant_map[determinant.name.lower()] = determinant
-
-        self._shared_det_ref_map: dict[str, SharedDeterminantRef] = {}
-        for ref in self.shared_determinant_refs:
-            self._shared_det_ref_map[ref.name.lower()] = ref
-
-        self._shared_lookup_ref_map: dict[str, SharedLookupRef] = {}
-        for ref in self.shared_lookup_refs:
-            self._shared_lookup_ref_map[ref.name.lower()] = ref
-
-        self._value_table_map: dict[str, ValueTable] = {}
-        for table in self.value_tables:
-            self._value_table_map[table.api_name.lower()] = table
-            self._value_table_map[table.name.lower()] = table
-
-        self._calculation_map: dict[str, Calculation] = {}
-        for calculation in self.calculations:
-            self._calculation_map[calculation.api_name.lower()] = calculation
-            self._calculation_map[calculation.name.lower()] = calculation
-
-        self._exclusion_table_map: dict[str, ExclusionTable] = {}
-        for table in self.exclusion_tables:
-            self._exclusion_table_map[table.api_name.lower()] = table
-            self._exclusion_table_map[table.name.lower()] = table
-
-        self._characterization_map: dict[str, Characterization] = {}
-        for characterization in self.characterizations:
-            key = characterization.name.lower()
-            self._characterization_map[key] = characterization
-            del key
-
-        self._permutation_map: dict[str, Permutation] = {}
-        for permutation in self.permutations:
-            key = permutation.reporting_name.lower()
-            self._permutation_map[key] = permutation
-            del key
+        self.__char_names = char_names
+        self.__perm_names = perm_names or []
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Measure):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.version_id == other.version_id
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        return hash(self.version_id)
+
     def __etrm_init(self) -> None:
         try:
             self.owner = self.get('owner', str)
@@ -860,35 +1083,99 @@ class Measure(JSONObject):
 
         return utils.to_date(self.end_date)
 
+    @cached_property
+    def characterizations(self) -> list[Characterization]:
+        return self.__get_characterizations(self.__char_names)
+
+    @cached_property
+    def permutations(self) -> list[Permutation]:
+        return self.__get_permutations(self.__perm_names)
+
+    @cached_property
+    def _determinant_map(self) -> dict[str, Determinant]:
+        determinant_map: dict[str, Determinant] = {}
+        for determinant in self.determinants:
+            determinant_map[determinant.api_name.lower()] = determinant
+            determinant_map[determinant.name.lower()] = determinant
+        return determinant_map
+
+    @cached_property
+    def _shared_det_ref_map(self) -> dict[str, SharedDeterminantRef]:
+        return {ref.name.lower(): ref for ref in self.shared_determinant_refs}
+
+    @cached_property
+    def _shared_lookup_ref_map(self) -> dict[str, SharedLookupRef]:
+        return {ref.name.lower(): ref for ref in self.shared_lookup_refs}
+
+    @cached_property
+    def _value_table_map(self) -> dict[str, ValueTable]:
+        value_table_map: dict[str, ValueTable] = {}
+        for table in self.value_tables:
+            value_table_map[table.api_name.lower()] = table
+            value_table_map[table.name.lower()] = table
+        return value_table_map
+
+    @cached_property
+    def _calculation_map(self) -> dict[str, Calculation]:
+        calculation_map: dict[str, Calculation] = {}
+        for calculation in self.calculations:
+            calculation_map[calculation.api_name.lower()] = calculation
+            calculation_map[calculation.name.lower()] = calculation
+        return calculation_map
+
+    @cached_property
+    def _exclusion_table_map(self) -> dict[str, ExclusionTable]:
+        exclusion_table_map: dict[str, ExclusionTable] = {}
+        for table in self.exclusion_tables:
+            exclusion_table_map[table.api_name.lower()] = table
+            exclusion_table_map[table.name.lower()] = table
+        return exclusion_table_map
+
+    @cached_property
+    def _characterization_map(self) -> dict[str, Characterization]:
+        return {
+            characterization.name.lower(): characterization
+                for characterization in self.characterizations
+        }
+
+    @cached_property
+    def _permutation_map(self) -> dict[str, Permutation]:
+        return {
+            permutation.reporting_name.lower(): permutation
+                for permutation in self.permutations
+        }
+
     def __get_characterizations(self,
-                                names: list[str]
+                                names: Sequence[str]
                                ) -> list[Characterization]:
-        characterizations: list[str] = []
+        characterizations: list[Characterization] = []
         for name in names:
-            try:
-                raw_content = self.get(name, str)
-            except IndexError:
+            if self.json.get(name) is None:
                 continue
 
-            content = ud.normalize('NFKD', raw_content)
+            raw_content = self.get(name, str)
+
+            # ASCII content is already in NFKD form
+            if raw_content.isascii():
+                content = raw_content
+            else:
+                content = ud.normalize('NFKD', raw_content)
+
             characterizations.append(Characterization(name, content))
 
         return characterizations
 
-    def __get_permutations(self, names: list[str]) -> list[Permutation]:
+    def __get_permutations(self,
+                           names: Sequence[str]
+                          ) -> list[Permutation]:
         if self.source != 'json':
             return []
 
-        permutations: list[Permutation] = []
-        for name in names:
-            try:
-                mapped_value = self.get(name, str)
-            except IndexError:
-                continue
-
-            permutations.append(Permutation(name, mapped_value))
-
-        return permutations
+        return [
+            Permutation(name, self.get(name, str))
+                for name in names
+                if self.json.get(name) is not None
+        ]
 
     def get_determinant(self, name: str) -> Determinant | None:
         return self._determinant_map.get(name.lower())
@@ -906,15 +1193,12 @@ class Measure(JSONObject):
         with the shared determinant names in `names`.
         """
 
-        refs: list[SharedDeterminantRef] = []
-        for name in names:
-            ref = self.get_shared_parameter(name)
-            if ref is not None:
-                refs.append(ref)
-        return refs
+        get_ref = self._shared_det_ref_map.get
+        refs = (get_ref(name.lower()) for name in names)
+        return [ref for ref in refs if ref is not None]
 
     def contains_parameter(self, name: str) -> bool:
-        return self.get_shared_parameter(name) is not None
+        return name.lower() in self._shared_det_ref_map
     
     @overload
     def get_value_table(self, name: str) -> ValueTable | None:
@@ -931,8 +1215,9 @@ class Measure(JSONObject):
         Returns `None` if no name has an associated value table.
         """
 
+        get_table = self._value_table_map.get
         for name in names:
-            table = self._value_table_map.get(name.lower())
+            table = get_table(name.lower())
             if table is not None:
                 return table
         return None
@@ -942,15 +1227,12 @@ class Measure(JSONObject):
         value table names in `names`.
         """
 
-        tables: list[ValueTable] = []
-        for name in names:
-            table = self.get_value_table(name)
-            if table is not None:
-                tables.append(table)
-        return tables
+        get_table = self._value_table_map.get
+        tables = (get_table(name.lower()) for name in names)
+        return [table for table in tables if table is not None]
 
     def contains_value_table(self, name: str) -> bool:
-        return self.get_value_table(name) is not None
+        return name.lower() in self._value_table_map
 
     def get_shared_lookup(self, name: str) -> SharedLookupRef | None:
         return self._shared_lookup_ref_map.get(name.lower())
@@ -960,24 +1242,19 @@ class Measure(JSONObject):
         shared value table names in `names`.
         """
 
-        refs: list[SharedLookupRef] = []
-        for name in names:
-            ref = self.get_shared_lookup(name)
-            if ref is not None:
-                refs.append(ref)
-        return refs
+        get_ref = self._shared_lookup_ref_map.get
+        refs = (get_ref(name.lower()) for name in names)
+        return [ref for ref in refs if ref is not None]
 
     def contains_shared_table(self, name: str) -> bool:
-        return self.get_shared_lookup(name) is not None
+        return name.lower() in self._shared_lookup_ref_map
 
     def contains_table(self, name: str) -> bool:
-        if self.contains_value_table(name):
-            return True
-
-        if self.contains_shared_table(name):
-            return True
-
-        return False
+        key = name.lower()
+        return (
+            key in self._value_table_map
+                or key in self._shared_lookup_ref_map
+        )
 
     def get_calculation(self, name: str) -> Calculation | None:
         return self._calculation_map.get(name.lower())
@@ -1003,19 +1280,51 @@ class Measure(JSONObject):
     def contains_characterization(self, name: str) -> bool:
         return self.get_characterization(name) is not None
 
-    def contains_mat_label(self, *labels: str) -> bool:
-        mat = self.get_shared_parameter('MeasAppType')
-        if mat is None:
-            raise RequiredContentError(name='Measure Application Type')
+    def __get_required_parameter(self,
+                                 name: str,
+                                 verbose_name: str
+                                ) -> SharedDeterminantRef:
+        """Returns the shared parameter `name`.
+
+        Raises a `RequiredContentError` if the measure does not contain
+        the parameter.
+        """
 
-        return set(labels).issubset(mat.active_labels)
+        param = self.get_shared_parameter(name)
+        if param is None:
+            raise RequiredContentError(name=verbose_name)
 
-    def is_deer(self) -> bool:
-        version = self.get_shared_parameter('version')
-        if version is None:
-            raise RequiredContentError(name='Version')
+        return param
+
+    @cached_property
+    def __mat(self) -> SharedDeterminantRef:
+        """The required Measure Application Type shared parameter."""
+
+        return self.__get_required_parameter(
+            'MeasAppType',
+            'Measure Application Type'
+        )
 
-        return 'DEER' in version.active_labels
+    @cached_property
+    def __delivery_type(self) -> SharedDeterminantRef:
+        """The required Delivery Type shared parameter."""
+
+        return self.__get_required_parameter('DelivType', 'Delivery Type')
+
+    @cached_property
+    def __lower_mat_labels(self) -> frozenset[str]:
+        """The lowercase active Measure Application Type labels."""
+
+        return frozenset(label.lower() for label in self.__mat.active_labels)
+
+    def contains_mat_label(self, *labels: str) -> bool:
+        return self.__lower_mat_labels.issuperset(
+            label.lower() for label in labels
+        )
+
+    def is_deer(self) -> bool:
+        version = self.__get_required_parameter('version', 'Version')
+        return 'DEER' in version.active_label_set
 
     def is_wen(self) -> bool:
         wen_param = self.get_shared_parameter('waterMeasureType')
@@ -1037,116 +1346,91 @@ class Measure(JSONObject):
         return False
 
     def is_deemed(self) -> bool:
-        delivery_table = self.get_shared_parameter('DelivType')
-        if delivery_table is None:
-            raise RequiredContentError(name='Delivery Type')
-
-        labels = delivery_table.active_labels
+        labels = self.__delivery_type.active_label_set
         return (
             'DnDeemDI' in labels
-                or set(['DnDeemed', 'UpDeemed']).issubset(labels)
+                or _DEEMED_PAIR.issubset(labels)
         )
 
     def is_fuel_sub(self) -> bool:
-        mat = self.get_shared_parameter('MeasImpactType')
-        if mat is None:
-            raise RequiredContentError(name='Measure Impact Type')
-
-        return 'FuelSub' in mat.active_labels
+        mat = self.__get_required_parameter(
+            'MeasImpactType',
+            'Measure Impact Type'
+        )
+        return 'FuelSub' in mat.active_label_set
 
     def is_sector_default(self) -> bool:
-        sector = self.get_shared_parameter('Sector')
-        if sector is None:
-            raise RequiredContentError(name='Sector')
-
-        ntg_id = self.get_shared_parameter('NTGID')
-        if ntg_id is None:
-            raise RequiredContentError(name='Net to Gross Ratio ID')
-
-        sectors = list(
-            map(
-                lambda sector: sector + '-Default',
-                sector.active_labels
-            )
+        sector = self.__get_required_parameter('Sector', 'Sector')
+
+        ntg_id = self.__get_required_parameter(
+            'NTGID',
+            'Net to Gross Ratio ID'
         )
 
-        for sector in sectors:
-            for _id in ntg_id.active_labels:
-                if sector in _id:
-                    return True
-        return False
+        # NTG IDs extend the sector default (e.g., Res-Default>2yrs), so
+        # a substring match is required rather than set equality
+        defaults = tuple(label + '-Default' for label in sector.active_labels)
+        return any(
+            default in _id
+                for _id in ntg_id.active_labels
+                for default in defaults
+        )
+
+    @cached_property
+    def __ntg_flags(self) -> tuple[bool, bool, bool]:
+        """Returns a three-tuple of the (residential default, non-residential
+        default, requires NTG version) flags of the NTG ID parameter.
+
+        All three flags are computed once from the active NTG ID labels.
+        """
+
+        ntg_id = self.__get_required_parameter(
+            'NTGID',
+            'Net to Gross Ratio ID'
+        )
+
+        labels = ntg_id.active_label_set
+        return (
+            'Res-Default>2yrs' in labels,
+            not _NONRES_DEFAULTS.isdisjoint(labels),
+            not _NTG_VERSION_EXEMPT.issuperset(labels)
+        )
 
     def requires_ntg_version(self) -> bool:
-        ntg_id = self.get_shared_parameter('NTGID')
-        if ntg_id == None:
-            raise RequiredContentError(name='Net to Gross Ratio ID')
-
-        for label in ntg_id.active_labels:
-            match label:
-                case ('Res-Default>2yrs'
-                        | 'Com-Default>2yrs'
-                        | 'Ind-Default>2yrs'
-                        | 'Agric-Default>2yrs'):
-                    continue
-                case _:
-                    return True
-        return False
+        return self.__ntg_flags[2]
 
     def requires_upstream_flag(self) -> bool:
-        delivery_type = self.get_shared_parameter('DelivType')
-        if delivery_type == None:
-            raise RequiredContentError(name='Delivery Type')
-
+        delivery_type = self.__delivery_type
         if len(delivery_type.active_labels) < 2:
             return False
 
-        return 'UpDeemed' in delivery_type.active_labels
+        return 'UpDeemed' in delivery_type.active_label_set
 
     def is_res_default(self) -> bool:
-        ntg_id = self.get_shared_parameter('NTGID')
-        if ntg_id == None:
-            raise RequiredContentError(name='Net to Gross Ratio ID')
-
-        return 'Res-Default>2yrs' in ntg_id.active_labels
+        return self.__ntg_flags[0]
 
     def is_nonres_default(self) -> bool:
-        ntg_id = self.get_shared_parameter('NTGID')
-        if ntg_id == None:
-            raise RequiredContentError(name='Net to Gross Ratio ID')
-
-        for label in ntg_id.active_labels:
-            match label:
-                case ('Com-Default>2yrs'
-                        | 'Ind-Default>2yrs'
-                        | 'Agric-Default>2yrs'):
-                    return True
-                case _:
-                    continue
-        return False
+        return self.__ntg_flags[1]
 
     def is_GSIA_default(self) -> bool:
-        gsia = self.get_shared_parameter('GSIAID')
-        if gsia == None:
-            raise RequiredContentError(name='GSIA ID')
-
-        return 'Def-GSIA' in gsia.active_labels
+        gsia = self.__get_required_parameter('GSIAID', 'GSIA ID')
+        return 'Def-GSIA' in gsia.active_label_set
 
     def is_interactive(self) -> bool:
-        lighting_type = self.get_shared_parameter('LightingType')
-        interactive_effect_app = self.get_value_table('IEApplicability')
-        commercial_effects = self.get_shared_lookup('commercialInteractiveEffects')
-        residential_effects = self.get_shared_lookup('residentialInteractiveEffects')
+        return (
+            self.contains_parameter('LightingType')
+                or self.contains_shared_table('commercialInteractiveEffects')
+                or self.contains_shared_table('residentialInteractiveEffects')
+        )
 
-        if lighting_type or (commercial_effects or residential_effects):
-            return True
-        # elif (lighting_type or (commercial_effects or residential_effects)
-        #       or interactive_effect_app):
-        #     raise MeasureFormatError(
-        #         'Missing required information for interactive effects')
+    def get_criteria(self) -> list[str]:
+        return list(self.__criteria)
 
-        return False
+    @cached_property
+    def __criteria(self) -> tuple[str, ...]:
+        """The measure criteria, determined once per measure."""
 
-    def get_criteria(self) -> list[str]:
+        mat = self.__mat
         criteria: list[str] = ['REQ']
 
         if self.is_deer():
@@ -1166,25 +1450,27 @@ class Measure(JSONObject):
         if self.is_interactive():
             criteria.append('INTER')
 
-        if self.is_res_default():
+        res_default, nonres_default, requires_ntg_version = self.__ntg_flags
+        if res_default:
             criteria.append('RES_DEF')
 
-        if self.is_nonres_default():
+        if nonres_default:
             criteria.append('RES_NDEF')
 
-        if not ('RES-DEF' in criteria or 'RES-NDEF' in criteria):
+        if not (res_default or nonres_default):
             criteria.append('RES')
 
-        mat_labels = self.get_shared_parameter('MeasAppType').active_labels
-        if 'AR' in mat_labels or 'AOE' in mat_labels:
+        mat_labels = mat.active_label_set
+        ar_aoe = 'AR' in mat_labels or 'AOE' in mat_labels
+        if ar_aoe:
             criteria.append('MAT_ARAOE')
 
         if 'NC' in mat_labels or 'NR' in mat_labels:
             criteria.append('MAT_NCNR')
-            if 'AR' in mat_labels or 'AOE' in mat_labels:
+            if ar_aoe:
                 criteria.append('MAT_NCNR_ARAOE')
 
-        if self.requires_ntg_version():
+        if requires_ntg_version:
             criteria.append('NTG')
 
         if self.requires_upstream_flag():
@@ -1193,29 +1479,44 @@ class Measure(JSONObject):
         if self.contains_value_table('emergingTech'):
             criteria.append('ET')
 
-        return criteria
+        return tuple(criteria)
 
     def get_table_column_criteria(self) -> list[str]:
+        return list(self.__table_column_criteria)
+
+    @cached_property
+    def __table_column_criteria(self) -> tuple[str, ...]:
+        """The measure table column criteria, determined once per measure."""
+
         criteria: list[str] = []
 
-        mat = self.get_shared_parameter('MeasAppType')
-        if 'AR' in mat.active_labels:
+        mat = self.__mat
+        if 'AR' in mat.active_label_set:
             criteria.append('AR_MAT')
             if len(mat.active_labels) > 2:
                 criteria.append('AR_M_MAT')
 
-        deliv = self.get_shared_parameter('DelivType')
-        if 'UpDeemed' in deliv.active_labels:
+        deliv = self.__delivery_type
+        if 'UpDeemed' in deliv.active_label_set:
             if len(deliv.active_labels) > 2:
                 criteria.append('UD_M_DT')
 
-        return criteria
+        return tuple(criteria)
 
     def get_permutation_criteria(self) -> list[str]:
+        return list(self.__permutation_criteria)
+
+    @cached_property
+    def __permutation_criteria(self) -> tuple[str, ...]:
+        """The measure permutation criteria, determined once per measure."""
+
         criteria: list[str] = []
 
-        mat = self.get_shared_parameter('MeasAppType')
-        if 'AR' in mat.active_labels:
+        mat = self.__mat
+        mat_labels = mat.active_label_set
+        has_ar = 'AR' in mat_labels
+        has_aoe = 'AOE' in mat_labels
+        if has_ar:
             criteria.append('AR_MAT')
             if len(mat.active_labels) == 1:
                 criteria.append('O_AR_MAT')
@@ -1224,12 +1525,12 @@ class Measure(JSONObject):
         else:
             criteria.append('N_AR_MAT')
 
-        if 'AOE' in mat.active_labels:
+        if has_aoe:
             criteria.append('AOE_MAT')
         else:
             criteria.append('N_AOE_MAT')
 
-        if 'AR' in mat.active_labels and 'AOE' in mat.active_labels:
+        if has_ar and has_aoe:
             criteria.append('AR_AOE_MAT')
             if len(mat.active_labels) == 2:
                 criteria.append('O_AR_AOE_MAT')
@@ -1241,11 +1542,21 @@ class Measure(JSONObject):
         if self.is_GSIA_default():
             criteria.append('DEF_GSIA')
 
-        criteria.append('PK_DMND')
-        criteria.append('ELCT_SVG')
-        criteria.append('GAS_SVG')
-        criteria.append('FBLC') # maybe in costs value table? ask chau
+        criteria.extend((
+            'PK_DMND',
+            'ELCT_SVG',
+            'GAS_SVG',
+            'FBLC' # maybe in costs value table? ask chau
+        ))
+
+        return tuple(criteria)
+
+    @cached_property
+    def __version_key(self) -> int:
+        """The version sorting key, parsed once per measure."""
+
+        return utils.version_key(self.version_id)
 
     @staticmethod
     def sorting_key(measure: Measure) -> int:
-        return utils.version_key(measure.version_id)
+        return measure.__version_key
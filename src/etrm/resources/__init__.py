@@ -1,5 +1,6 @@
 import os
 from typing import Literal
+from functools import lru_cache
 from configparser import ConfigParser
 
 from src.etrm.exceptions import ETRMError
@@ -23,7 +24,14 @@ def get_path(file_name: str) -> str:
     return file_path
 
 
+@lru_cache(maxsize=2)
 def get_api_key(role: Literal['user', 'admin']='user') -> str:
+    """Returns the eTRM API key of `role` from config.ini.
+
+    Keys are read once per role; call `get_api_key.cache_clear()` to
+    reload them after config.ini changes.
+    """
+
     match role:
         case 'user':
             source = 'etrm'
@@ -1,4 +1,3 @@
-import re
 import logging
 
 from src.etrm import patterns
@@ -15,7 +14,7 @@ logger = logging.getLogger(__name__)
 def sanitize_api_key(api_key: str) -> str:
     logger.info(f'Sanitizing API key: {api_key}')
 
-    re_match = re.fullmatch(patterns.API_KEY, api_key)
+    re_match = patterns.API_KEY.fullmatch(api_key)
     if re_match is None:
         err_msg = f'Invalid API key: {api_key}'
         logger.info(err_msg)
@@ -35,15 +34,16 @@ def sanitize_api_key(api_key: str) -> str:
 def sanitize_statewide_id(statewide_id: str) -> str:
     logger.info(f'Sanitizing statewide ID: {statewide_id}')
 
-    re_match = re.search(patterns.STATEWIDE_WHITELIST, statewide_id)
-    if re_match is not None:
-        err_msg = f'Statewide ID {statewide_id} contains invalid characters'
-        logger.info(err_msg)
-        raise ETRMRequestError(err_msg)
-
-    re_match = re.fullmatch(patterns.STWD_ID, statewide_id)
+    # a valid statewide ID is strictly alphanumeric, so the whitelist
+    # only needs to be checked to explain a failed match
+    re_match = patterns.STWD_ID.fullmatch(statewide_id)
     if re_match is None:
-        err_msg = f'Invalid statewide ID: {statewide_id}'
+        if patterns.STATEWIDE_WHITELIST.search(statewide_id) is not None:
+            err_msg = (
+                f'Statewide ID {statewide_id} contains invalid characters'
+            )
+        else:
+            err_msg = f'Invalid statewide ID: {statewide_id}'
         logger.info(err_msg)
         raise ETRMRequestError(err_msg)
 
@@ -60,13 +60,13 @@ def sanitize_statewide_id(statewide_id: str) -> str:
 def sanitize_measure_id(measure_id: str) -> str:
     logger.info(f'Sanitizing measure ID: {measure_id}')
 
-    re_match = re.search(patterns.VERSION_WHITELIST, measure_id)
+    re_match = patterns.VERSION_WHITELIST.search(measure_id)
     if re_match is not None:
         err_msg = f'Measure version {measure_id} contains invalid characters'
         logger.info(err_msg)
         raise ETRMRequestError(err_msg)
 
-    re_match = re.fullmatch(patterns.VERSION_ID, measure_id)
+    re_match = patterns.VERSION_ID.fullmatch(measure_id)
     if re_match is None:
         err_msg = f'Invalid measure version: {measure_id}'
         logger.info(err_msg)
@@ -85,7 +85,7 @@ def sanitize_measure_id(measure_id: str) -> str:
 def sanitize_reference(ref_id: str) -> str:
     logger.info(f'Sanitizing reference ID: {ref_id}')
 
-    re_match = re.search(patterns.REFERENCE_WHITELIST, ref_id)
+    re_match = patterns.REFERENCE_WHITELIST.search(ref_id)
     if re_match is not None:
         err_msg = f'Reference ID {ref_id} contains invalid characters'
         logger.info(err_msg)
@@ -98,7 +98,11 @@ def sanitize_reference(ref_id: str) -> str:
 def sanitize_table_name(table_name: str) -> str:
     logger.info(f'Sanitizing value table name: {table_name}')
 
-    re_match = re.search(patterns.TABLE_NAME_WHITELIST, table_name)
+    # ASCII alphanumeric names cannot match the whitelist pattern
+    if table_name.isascii() and table_name.isalnum():
+        return table_name
+
+    re_match = patterns.TABLE_NAME_WHITELIST.search(table_name)
     if re_match is not None:
         err_msg = f'Table name {table_name} contains invalid characters'
         logger.info(err_msg)
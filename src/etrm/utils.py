@@ -1,8 +1,7 @@
-import re
 import json
 import datetime as dt
-import jsonschema as jschema
-from typing import Any
+from typing import Any, TYPE_CHECKING
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from src.etrm import resources, patterns
@@ -11,35 +10,35 @@ from src.etrm.exceptions import (
     SchemaError
 )
 
+if TYPE_CHECKING:
+    import jsonschema as jschema
+
 
 def version_key(full_version_id: str) -> int:
     """Sorting key for measure versions."""
 
-    re_match = re.fullmatch(patterns.VERSION_ID, full_version_id)
-    if re_match is None:
+    # parsed by hand rather than with `patterns.VERSION_ID`, as this
+    # is the sort key for every measure in a version listing
+    statewide_id, sep, version_id = full_version_id.partition('-')
+    if (not sep
+            or len(statewide_id) < 6
+            or not statewide_id.isascii()
+            or not statewide_id[:4].isalpha()
+            or not statewide_id[4:].isdigit()):
         return -1
 
-    key = 0
-    measure_type = re_match.group(3)
-    key += sum([ord(c) * 1000 for c in measure_type])
-
-    use_category = re_match.group(4)
-    key += sum([ord(c) * 1000 for c in use_category])
-
-    uc_version = re_match.group(5)
-    key += int(uc_version) * 100
+    version, sep, draft_version = version_id.partition('-')
+    if (not version.isascii()
+            or not version.isdigit()
+            or (sep and (draft_version == '' or '\n' in draft_version))):
+        return -1
 
-    version_id = re_match.group(6)
-    try:
-        version, _ = version_id.split('-', 1)
-        version = int(version)
-        draft = 0
-    except ValueError:
-        version = int(version_id)
-        draft = -1
-
-    key += version * -10
-    key += draft
+    key = 0
+    key += (ord(statewide_id[0]) + ord(statewide_id[1])) * 1000
+    key += (ord(statewide_id[2]) + ord(statewide_id[3])) * 1000
+    key += int(statewide_id[4:]) * 100
+    key += int(version) * -10
+    key += 0 if sep else -1
     return key
 
 
@@ -48,7 +47,16 @@ def to_date(date_str: str) -> dt.date:
     datetime object.
     """
 
-    if not re.fullmatch(patterns.DATE, date_str):
+    # zero-padded dates are parsed directly by the C implementation
+    if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+        try:
+            return dt.date.fromisoformat(date_str)
+        except ValueError as err:
+            raise RuntimeError(
+                f'Invalid Date Format: {date_str}'
+            ) from err
+
+    if not patterns.DATE.fullmatch(date_str):
         raise RuntimeError(
             f'Invalid Date Format: {date_str}'
         )
@@ -80,12 +88,11 @@ class ParsedUrl:
             return {}
 
         url_queries: dict[str, str | None] = {}
-        queries = query_str.split('&')
-        for query in queries:
-            try:
-                key, val = query.split('=')
-                url_queries[key] = val
-            except ValueError:
+        for query in query_str.split('&'):
+            pair = query.split('=')
+            if len(pair) == 2:
+                url_queries[pair[0]] = pair[1]
+            else:
                 url_queries[query] = None
         return url_queries
 
@@ -94,8 +101,14 @@ def parse_url(url: str) -> ParsedUrl:
     return ParsedUrl(url)
 
 
-def is_etrm_measure(measure_json: dict[str, Any]) -> bool:
-    """Validates the provided measure json against a JSON schema."""
+@lru_cache(maxsize=1)
+def __get_measure_validator() -> 'jschema.protocols.Validator':
+    """Returns a validator for the measure JSON schema.
+
+    The schema is read and checked once, then reused for every measure.
+    """
+
+    import jsonschema as jschema
 
     try:
         schema_path = resources.get_path('measure.schema.json')
@@ -119,10 +132,12 @@ def is_etrm_measure(measure_json: dict[str, Any]) -> bool:
             f' file {schema_path}'
         ) from err
 
-    try:
-        jschema.validate(instance=measure_json, schema=schema_json)
-        return True
-    except jschema.ValidationError:
-        pass
+    validator_cls = jschema.validators.validator_for(schema_json)
+    validator_cls.check_schema(schema_json)
+    return validator_cls(schema_json)
+
+
+def is_etrm_measure(measure_json: dict[str, Any]) -> bool:
+    """Validates the provided measure json against a JSON schema."""
 
-    return False
+    return __get_measure_validator().is_valid(measure_json)
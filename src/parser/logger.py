@@ -13,11 +13,20 @@ class MeasureDataLogger:
                  output_path: str,
                  data: ParserData):
         self.measure = measure
-        self.out = open(output_path, 'w+')
+        self.out = open(output_path, 'w', encoding='utf-8')
         self.data = data
+        self.__lines: list[str] = []
+
+    def flush(self) -> None:
+        """Writes all buffered log lines to the output file."""
+
+        if self.__lines != []:
+            self.out.write(''.join(self.__lines))
+            self.__lines.clear()
 
     def close(self):
-        if self.out != None:
+        if self.out is not None:
+            self.flush()
             self.out.close()
 
     def __exit__(self, *args):
@@ -27,7 +36,7 @@ class MeasureDataLogger:
         return self
 
     def log(self, *values: object):
-        print(*values, file=self.out)
+        self.__lines.append(' '.join(map(str, values)) + '\n')
 
     def log_measure_details(self) -> None:
         """Logs measure identification details."""
@@ -52,21 +61,11 @@ class MeasureDataLogger:
         param_data = self.data.parameter
         self.log('Parameters:')
 
-        nonshared_names = list(
-            map(
-                lambda param: param.name,
-                param_data.nonshared
-            )
-        )
+        nonshared_names = [param.name for param in param_data.nonshared]
         self.log(f'\tMeasure Specific Parameters: {nonshared_names}')
         self.log()
 
-        unexpected_names = list(
-            map(
-                lambda param: param.name,
-                param_data.unexpected
-            )
-        )
+        unexpected_names = [param.name for param in param_data.unexpected]
         self.log(f'\tUnexpected Shared Parameters: {unexpected_names}')
         self.log(f'\tMissing Shared Parameters: {param_data.missing}')
         self.log()
@@ -125,23 +124,13 @@ class MeasureDataLogger:
 
         self.log('Value Tables:')
         shared_data = self.data.value_table.shared
-        unexpected_names = list(
-            map(
-                lambda table: table.name,
-                shared_data.unexpected
-            )
-        )
+        unexpected_names = [table.name for table in shared_data.unexpected]
         self.log(f'\tUnexpected Shared Tables: {unexpected_names}')
         self.log(f'\tMissing Shared Tables: {shared_data.missing}')
         self.log()
 
         nonshared_data = self.data.value_table.nonshared
-        unexpected_names = list(
-            map(
-                lambda table: table.name,
-                nonshared_data.unexpected
-            )
-        )
+        unexpected_names = [table.name for table in nonshared_data.unexpected]
         self.log(f'\tUnexpected Non-Shared Tables: {unexpected_names}')
         self.log(f'\tMissing Non-Shared Tables: {nonshared_data.missing}')
         self.log()
@@ -203,8 +192,8 @@ class MeasureDataLogger:
         """
 
         self.log('Standard Non-Shared Value Tables:')
-        for table in self.measure.value_tables:
-            if self.measure.value_tables.index(table) != 0:
+        for i, table in enumerate(self.measure.value_tables):
+            if i != 0:
                 self.log()
             self.log(f'\tTable Name: {table.name}\n'
                      f'\t\tAPI Name: {table.api_name}\n'
@@ -228,8 +217,8 @@ class MeasureDataLogger:
         """
 
         self.log('Calculations:')
-        for calculation in self.measure.calculations:
-            if self.measure.calculations.index(calculation) != 0:
+        for i, calculation in enumerate(self.measure.calculations):
+            if i != 0:
                 self.log()
             self.log(f'\tCalculation Name: {calculation.name}\n'
                      f'\t\tAPI Name: {calculation.api_name}\n'
@@ -260,12 +249,12 @@ class MeasureDataLogger:
             self.log('\tAll permutations are valid')
         self.log()
 
-        for permutation in self.measure.permutations:
+        for i, permutation in enumerate(self.measure.permutations):
             perm_data = db.get_permutation_data(
                 permutation.reporting_name
             )
 
-            if self.measure.permutations.index(permutation) != 0:
+            if i != 0:
                 self.log()
             try:
                 verbose_name = perm_data['verbose']
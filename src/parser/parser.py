@@ -38,7 +38,7 @@ class MeasureParser:
 
         names = db.get_all_characterization_names(self.measure.source)
         for char_name in names:
-            if self.measure.get_characterization(char_name) == None:
+            if self.measure.get_characterization(char_name) is None:
                 self.data.characterization[char_name].missing = True
         self.characterization_parser = CharacterizationParser(
             self.data.characterization,
@@ -298,23 +298,23 @@ class MeasureParser:
         get_value_table: function = self.measure.get_value_table
         match reporting_name:
             case 'BaseCase2nd':
-                if ('AR' in get_param('MeasAppType').active_labels):
+                if ('AR' in get_param('MeasAppType').active_label_set):
                     valid_name = 'measOffer__descBase2'
             
             case 'Upstream_Flag':
-                if ('UpDeemed' in get_param('DelivType').active_labels):
+                if ('UpDeemed' in get_param('DelivType').active_label_set):
                     valid_name = 'upstreamFlag__upstreamFlag'
 
             case 'WaterUse':
-                if (get_param('waterMeasureType') != None):
+                if (get_param('waterMeasureType') is not None):
                     valid_name = 'p.waterMeasureType__label'
 
             case 'ETP_Flag':
-                if (get_value_table('emergingTech') != None):
+                if (get_value_table('emergingTech') is not None):
                     valid_name = 'emergingTech__projectNumber'
 
             case 'ETP_YearFirstIntroducedToPrograms':
-                if (get_value_table('emergingTech') != None):
+                if (get_value_table('emergingTech') is not None):
                     valid_name = 'emergingTech__introYear'
 
             case 'RUL_Yrs':
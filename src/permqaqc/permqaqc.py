@@ -692,13 +692,13 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             cnst.EXISTING_DESCRIPTION,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             description='Value cannot be blank'
         )
 
         self.check_columns(
             cnst.EXISTING_DESCRIPTION,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             severity=Severity.OPTIONAL,
             description='Value cannot be blank'
         )
@@ -717,13 +717,13 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             cnst.SECOND_BASE_CASE_DESCRIPTION,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             description='Value cannot be blank'
         )
 
         self.check_columns(
             cnst.SECOND_BASE_CASE_DESCRIPTION,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             negate=True,
             description='Value must be blank'
         )
@@ -840,14 +840,14 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             *cnst.SECOND_BASELINE_UES_COLS,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             func=lambda val: not is_number(val),
             description='Value must be a number'
         )
 
         self.check_columns(
             *cnst.SECOND_BASELINE_UES_COLS,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             func=lambda val: not is_zero(val),
             description='Value must be zero'
         )
@@ -877,7 +877,7 @@ class PermutationQAQC:
 
         for col_name in cost_cols:
             invalid = df[
-                ~df[cnst.MEASURE_APPLICATION_TYPE].isin(['NR', 'NC'])
+                ~self.permutations.get_mat_mask('NR', 'NC')
                     & ~df[col_name].eq('0')
             ][col_name]
             for index, value in invalid.items():
@@ -888,7 +888,7 @@ class PermutationQAQC:
                 )
 
             invalid = df[
-                df[cnst.MEASURE_APPLICATION_TYPE].isin(['NC', 'NR'])
+                self.permutations.get_mat_mask('NC', 'NR')
                     & ~df[col_name].apply(is_number)
             ][col_name]
             for index, value in invalid.items():
@@ -905,7 +905,7 @@ class PermutationQAQC:
 
             numeric_df = self.get_numeric_data(
                 col_name,
-                df=df[df[cnst.MEASURE_APPLICATION_TYPE].isin(['NR', 'NC'])]
+                df=df[self.permutations.get_mat_mask('NR', 'NC')]
             )
 
             invalid = numeric_df[
@@ -983,13 +983,13 @@ class PermutationQAQC:
         self.check_columns(
             cnst.SECOND_BASELINE_LC,
             cnst.SECOND_BASELINE_MC,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             func=lambda val: not is_number(val) or is_negative(val),
             description='Value must be a non-negative number'
         )
 
         non_zero_vals = df[
-            df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')
+            self.permutations.get_mat_mask('AR')
                 & ~df[cnst.SECOND_BASELINE_LC].eq(0)
         ]
         if non_zero_vals.empty:
@@ -1000,7 +1000,7 @@ class PermutationQAQC:
             )
 
         non_zero_vals = df[
-            df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')
+            self.permutations.get_mat_mask('AR')
                 & ~df[cnst.SECOND_BASELINE_MC].eq(0)
         ]
         if non_zero_vals.empty:
@@ -1013,7 +1013,7 @@ class PermutationQAQC:
         self.check_columns(
             cnst.SECOND_BASELINE_LC,
             cnst.SECOND_BASELINE_MC,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             func=is_zero,
             negate=True,
             description='Value must be zero'
@@ -1044,7 +1044,7 @@ class PermutationQAQC:
         self.check_columns(
             cnst.SECOND_BASELINE_MTC,
             severity=Severity.SEMI_CRITICAL,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             func=is_positive,
             negate=True,
             numeric=True,
@@ -1053,7 +1053,7 @@ class PermutationQAQC:
 
         self.check_columns(
             cnst.SECOND_BASELINE_MTC,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             func=is_zero,
             negate=True,
             numeric=True,
@@ -1111,7 +1111,7 @@ class PermutationQAQC:
 
         df = self.permutations.data
         invalid = df[
-            ~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')
+            ~self.permutations.get_mat_mask('AR')
                 & ~df[cnst.EUL_YEARS].eq(df[cnst.FIRST_BASELINE_LIFE_CYCLE])
         ][cnst.EUL_YEARS]
         for index, value in invalid.items():
@@ -1137,14 +1137,14 @@ class PermutationQAQC:
         valid_eul_ids = db.get_eul_ids()
         self.check_columns(
             cnst.RUL_ID,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].isin(['AR', 'AOE'])],
+            df=df[self.permutations.get_mat_mask('AR', 'AOE')],
             func=lambda val: val not in valid_eul_ids,
             description='Value is not a valid EUL ID'
         )
 
         self.check_columns(
             cnst.RUL_ID,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].isin(['AR', 'AOE'])],
+            df=df[~self.permutations.get_mat_mask('AR', 'AOE')],
             negate=True,
             description='Value must be blank'
         )
@@ -1165,7 +1165,7 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             cnst.RUL_YEARS,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             func=is_positive,
             negate=True,
             description='Value must be a positive number'
@@ -1174,7 +1174,7 @@ class PermutationQAQC:
         numeric_df = self.get_numeric_data(
             cnst.RUL_YEARS,
             cnst.EUL_YEARS,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')]
+            df=df[self.permutations.get_mat_mask('AR')]
         )
 
         invalid = numeric_df[
@@ -1190,7 +1190,7 @@ class PermutationQAQC:
 
         self.check_columns(
             cnst.RUL_YEARS,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             func=is_zero,
             negate=True,
             description='Value must be zero'
@@ -1227,7 +1227,7 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             cnst.SECOND_BASELINE_LIFE_CYCLE,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             func=is_positive,
             negate=True,
             description='Value must be a positive number'
@@ -1235,7 +1235,7 @@ class PermutationQAQC:
 
         self.check_columns(
             cnst.SECOND_BASELINE_LIFE_CYCLE,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             func=is_zero,
             negate=True,
             description='Value must be zero'
@@ -1296,7 +1296,7 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             *cnst.SECOND_BASELINE_UEC_COLS,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[self.permutations.get_mat_mask('AR')],
             func=is_number,
             negate=True,
             description='Value must be a number'
@@ -1304,7 +1304,7 @@ class PermutationQAQC:
 
         self.check_columns(
             *cnst.SECOND_BASELINE_UEC_COLS,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')],
+            df=df[~self.permutations.get_mat_mask('AR')],
             func=is_zero,
             negate=True,
             description='Value must be zero'
@@ -1680,7 +1680,7 @@ class PermutationQAQC:
         df = self.permutations.data
         for col_name in cnst.SECOND_BASELINE_WS_COLS:
             invalid = df[
-                df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')
+                self.permutations.get_mat_mask('AR')
                     & ~df[cnst.WATER_MEASURE_TYPE].eq('')
                     & ~df[col_name].apply(is_number)
             ][col_name]
@@ -1693,7 +1693,7 @@ class PermutationQAQC:
 
             invalid = df[
                 ~df[col_name].eq('0')
-                    & (~df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')
+                    & (~self.permutations.get_mat_mask('AR')
                         | df[cnst.WATER_MEASURE_TYPE].eq(''))
             ][col_name]
             for index in invalid.index:
@@ -1733,7 +1733,7 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             cnst.PRE_TECH_ID,
-            df=df[~df[cnst.MEASURE_APPLICATION_TYPE].isin(['NC', 'NR'])],
+            df=df[~self.permutations.get_mat_mask('NC', 'NR')],
             description='Value cannot be blank'
         )
 
@@ -1749,7 +1749,7 @@ class PermutationQAQC:
         df = self.permutations.data
         self.check_columns(
             cnst.STD_TECH_ID,
-            df=df[df[cnst.MEASURE_APPLICATION_TYPE].isin(['NC', 'NR'])],
+            df=df[self.permutations.get_mat_mask('NC', 'NR')],
             description='Value cannot be blank'
         )
 
@@ -2327,7 +2327,7 @@ class PermutationQAQC:
         df = self.permutations.data
 
         self.check_sum(
-            df.loc[df[cnst.MEASURE_APPLICATION_TYPE].isin(['NC', 'NR'])],
+            df.loc[self.permutations.get_mat_mask('NC', 'NR')],
             cnst.FIRST_BASELINE_LC,
             cnst.FIRST_BASELINE_MC,
             negate=True,
@@ -2382,7 +2382,7 @@ class PermutationQAQC:
     @qa_qc_method
     def validate_second_baseline_cost_calculations(self) -> None:
         df = self.permutations.data
-        df = df.loc[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')]
+        df = df.loc[self.permutations.get_mat_mask('AR')]
 
         self.check_sum(
             df,
@@ -2503,7 +2503,7 @@ class PermutationQAQC:
     @qa_qc_method
     def validate_second_baseline_ues_calculations(self) -> None:
         df = self.permutations.data
-        df = df.loc[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')]
+        df = df.loc[self.permutations.get_mat_mask('AR')]
 
         self.check_ues_difference(
             cnst.SECOND_BASELINE_PEDR,
@@ -2529,7 +2529,7 @@ class PermutationQAQC:
     @qa_qc_method
     def validate_rul_eul_year_difference(self) -> None:
         df = self.permutations.data
-        df = df.loc[df[cnst.MEASURE_APPLICATION_TYPE].eq('AR')]
+        df = df.loc[self.permutations.get_mat_mask('AR')]
         df = self.get_numeric_data(
             cnst.RUL_YEARS,
             cnst.EUL_YEARS,
@@ -69,16 +69,20 @@ def getc(o: dict,
             raise
         return default
 
+    # plain classes are cast directly, skipping generic type introspection
+    if type(_type) is type or get_origin(_type) is None:
+        try:
+            return _type(attr)
+        except Exception as err:
+            raise TypeError(
+                f'cannot cast attribute to type {_type}'
+            ) from err
+
     attr_type = type(attr)
     _types = get_args(_type)
     _origin = get_origin(_type)
 
-    if _origin is None:
-        try:
-            return _type(attr)
-        except:
-            raise TypeError(f'cannot cast attribute to type {_type}')
-    elif _origin is list:
+    if _origin is list:
         if not isinstance(attr, list):
             raise TypeError(f'field {name} does not map to a list')
 
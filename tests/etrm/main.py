@@ -0,0 +1,21 @@
+import unittest as ut
+
+from tests.etrm import (
+    value_tables,
+    permutations_table,
+    measure_criteria
+)
+
+
+def suites() -> list[ut.TestSuite]:
+    return [
+        value_tables.suite(),
+        permutations_table.suite(),
+        measure_criteria.suite()
+    ]
+
+
+if __name__ == '__main__':
+    runner = ut.TextTestRunner()
+    for suite in suites():
+        runner.run(suite)
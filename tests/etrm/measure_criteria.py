@@ -0,0 +1,184 @@
+import unittest as ut
+from typing import Any, Sequence
+
+from src.etrm.models import Measure
+from tests.utils import get_test_methods
+
+
+def shared_ref_json(name: str, labels: Sequence[str]) -> dict[str, Any]:
+    return {
+        'order': 1,
+        'version': {'version_string': f'{name}-001'},
+        'active_labels': list(labels),
+        'url': ''
+    }
+
+
+def measure_json(mat_labels: Sequence[str]=('NR',),
+                 ntg_labels: Sequence[str]=('Com-Default>2yrs',),
+                 **fields: Any
+                ) -> dict[str, Any]:
+    return {
+        'owned_by_user': '',
+        'MeasureID': 'SWCR002',
+        'MeasureVersionID': 'SWCR002-03',
+        'MeasureName': 'Display Case Doors',
+        'UseCategory': 'CR',
+        'PALead': 'SCE',
+        'StartDate': '2023-01-01',
+        'EndDate': None,
+        'Status': 'CPUC Approved',
+        'determinants': [],
+        'shared_determinant_refs': [
+            shared_ref_json('MeasAppType', mat_labels),
+            shared_ref_json('DelivType', ['DnDeemed']),
+            shared_ref_json('NTGID', ntg_labels),
+            shared_ref_json('Sector', ['Com']),
+            shared_ref_json('version', ['DEER']),
+            shared_ref_json('GSIAID', ['Def-GSIA']),
+            shared_ref_json('MeasImpactType', ['Deemed'])
+        ],
+        'shared_lookup_refs': [],
+        'value_tables': [],
+        'calculations': [],
+        'exclusion_tables': [],
+        **fields
+    }
+
+
+class TestMeasureCriteria(ut.TestCase):
+    def test_res_criteria(self):
+        measure = Measure(
+            measure_json(ntg_labels=['Res-Default>2yrs']),
+            'json',
+            []
+        )
+        criteria = measure.get_criteria()
+        self.assertIn('RES_DEF', criteria)
+        self.assertNotIn('RES_NDEF', criteria)
+        self.assertNotIn('RES', criteria)
+
+        measure = Measure(
+            measure_json(ntg_labels=['Com-Default>2yrs']),
+            'json',
+            []
+        )
+        criteria = measure.get_criteria()
+        self.assertIn('RES_NDEF', criteria)
+        self.assertNotIn('RES_DEF', criteria)
+        self.assertNotIn('RES', criteria)
+
+        measure = Measure(
+            measure_json(ntg_labels=['ComDI-Lighting']),
+            'json',
+            []
+        )
+        criteria = measure.get_criteria()
+        self.assertIn('RES', criteria)
+        self.assertNotIn('RES_DEF', criteria)
+        self.assertNotIn('RES_NDEF', criteria)
+
+
+    def test_permutation_criteria(self):
+        measure = Measure(
+            measure_json(mat_labels=['AR', 'AOE']),
+            'json',
+            []
+        )
+        expected = [
+            'AR_MAT', 'M_AR_MAT', 'AOE_MAT', 'AR_AOE_MAT', 'O_AR_AOE_MAT',
+            'DEF_GSIA', 'PK_DMND', 'ELCT_SVG', 'GAS_SVG', 'FBLC'
+        ]
+        criteria = measure.get_permutation_criteria()
+        self.assertEqual(criteria, expected)
+
+        # callers receive a copy of the cached criteria
+        criteria.clear()
+        self.assertEqual(measure.get_permutation_criteria(), expected)
+
+
+    def test_contains_mat_label(self):
+        measure = Measure(measure_json(mat_labels=['NR', 'AR']), 'json', [])
+        self.assertTrue(measure.contains_mat_label('NR'))
+        self.assertTrue(measure.contains_mat_label('ar', 'Nr'))
+        self.assertFalse(measure.contains_mat_label('NR', 'NC'))
+
+        other = Measure(measure_json(mat_labels=['NR', 'AR']), 'json', [])
+        self.assertEqual(
+            measure.get_shared_parameter('MeasAppType'),
+            other.get_shared_parameter('MeasAppType')
+        )
+
+
+class TestMeasureContent(ut.TestCase):
+    def test_absent_fields(self):
+        measure = Measure(
+            measure_json(),
+            'json',
+            ['TechnologySummary', 'BaseCase'],
+            ['RUL_Yrs', 'OfferingID']
+        )
+        self.assertEqual(measure.characterizations, [])
+        self.assertEqual(measure.permutations, [])
+        self.assertIsNone(measure.get_characterization('TechnologySummary'))
+        self.assertIsNone(measure.get_permutation('RUL_Yrs'))
+
+
+    def test_null_fields(self):
+        measure = Measure(
+            measure_json(TechnologySummary=None, RUL_Yrs=None),
+            'json',
+            ['TechnologySummary', 'BaseCase'],
+            ['RUL_Yrs', 'OfferingID']
+        )
+        self.assertEqual(measure.characterizations, [])
+        self.assertEqual(measure.permutations, [])
+        self.assertIsNone(measure.get_characterization('TechnologySummary'))
+        self.assertIsNone(measure.get_permutation('RUL_Yrs'))
+
+
+    def test_present_fields(self):
+        measure = Measure(
+            measure_json(
+                TechnologySummary='<p>Summary</p>',
+                RUL_Yrs='Null__ZeroYrs'
+            ),
+            'json',
+            ['TechnologySummary', 'BaseCase'],
+            ['RUL_Yrs', 'OfferingID']
+        )
+        self.assertEqual(
+            [char.name for char in measure.characterizations],
+            ['TechnologySummary']
+        )
+        self.assertEqual(
+            measure.get_characterization('TechnologySummary').content,
+            '<p>Summary</p>'
+        )
+        self.assertEqual(
+            [perm.reporting_name for perm in measure.permutations],
+            ['RUL_Yrs']
+        )
+        self.assertEqual(
+            measure.get_permutation('RUL_Yrs').mapped_name,
+            'Null__ZeroYrs'
+        )
+
+
+def suite() -> ut.TestSuite:
+    suite = ut.TestSuite()
+    test_cases: list[ut.TestCase] = [
+        TestMeasureCriteria,
+        TestMeasureContent
+    ]
+
+    for test_case in test_cases:
+        methods = get_test_methods(test_case)
+        suite.addTests(methods)
+
+    return suite
+
+
+if __name__ == '__main__':
+    runner = ut.TextTestRunner()
+    runner.run(suite())
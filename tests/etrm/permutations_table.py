@@ -0,0 +1,176 @@
+import os
+import warnings
+import tempfile
+import unittest as ut
+from typing import Any
+
+from src.etrm.models import PermutationsTable
+from src.etrm.exceptions import ETRMResponseError, ETRMConnectionError
+from tests.utils import get_test_methods
+
+
+HEADERS = ['MeasAppType', 'UnitkW1stBaseline']
+
+
+def permutations_json(results: list[list[Any]],
+                      headers: list[str]=HEADERS
+                     ) -> dict[str, Any]:
+    return {
+        'count': len(results),
+        'headers': headers,
+        'results': results
+    }
+
+
+class TestPermutationsTableJoin(ut.TestCase):
+    def test_join(self):
+        table = PermutationsTable(permutations_json([
+            ['NR', 1.5],
+            ['AR', 2.0]
+        ]))
+        page = PermutationsTable(permutations_json([
+            ['NC', None],
+            [None, None]
+        ]))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            table.join(page)
+
+        expected = PermutationsTable(permutations_json([
+            ['NR', 1.5],
+            ['AR', 2.0],
+            ['NC', None],
+            [None, None]
+        ]))
+        self.assertEqual(table.count, 4)
+        self.assertTrue(table.data.equals(expected.data))
+        self.assertEqual(table.data.index.tolist(), [0, 1, 2, 3])
+        self.assertEqual(table.get_baseline_avg('PEDR_1', 'NC', 'NR'), 1.5)
+
+
+    def test_join_pages(self):
+        pages = [
+            PermutationsTable(permutations_json([['NR', float(i)]]))
+                for i in range(3)
+        ]
+        pages.append(PermutationsTable(permutations_json([[None, None]])))
+        table = PermutationsTable(permutations_json([['AR', 4.0]]))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            table.join(*pages)
+
+        expected = PermutationsTable(permutations_json([
+            ['AR', 4.0],
+            ['NR', 0.0],
+            ['NR', 1.0],
+            ['NR', 2.0],
+            [None, None]
+        ]))
+        self.assertEqual(table.count, 5)
+        self.assertTrue(table.data.equals(expected.data))
+        self.assertEqual(
+            table.data.dtypes.tolist(),
+            expected.data.dtypes.tolist()
+        )
+
+
+    def test_join_empty(self):
+        table = PermutationsTable(permutations_json([]))
+        page = PermutationsTable(permutations_json([['NR', 1.5]]))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            table.join(page)
+            page.join(PermutationsTable(permutations_json([])))
+
+        self.assertEqual(table.count, 1)
+        self.assertEqual(table.data.values.tolist(), [['NR', 1.5]])
+        self.assertEqual(page.count, 1)
+        self.assertEqual(page.data.values.tolist(), [['NR', 1.5]])
+
+
+    def test_join_headers(self):
+        table = PermutationsTable(permutations_json([['NR', 1.5]]))
+        page = PermutationsTable(
+            permutations_json([['NR', 1.5]], headers=['MeasAppType', 'x'])
+        )
+
+        with self.assertRaises(ETRMResponseError):
+            table.join(page)
+
+
+class TestPermutationsTableBaselines(ut.TestCase):
+    def test_baseline_avg(self):
+        table = PermutationsTable(permutations_json([
+            ['NR', 1.0],
+            ['NC', 3.0],
+            ['AR', 10.0],
+            ['AR', None]
+        ]))
+        self.assertEqual(table.get_baseline_avg('PEDR_1', 'NC', 'NR'), 2.0)
+        self.assertEqual(table.get_baseline_avg('PEDR_1', 'NR', 'NC'), 2.0)
+        self.assertEqual(table.get_baseline_avg('PEDR_1', 'AR'), 10.0)
+        self.assertEqual(
+            table.get_baseline_avg('PEDR_1', 'NR', 'NC', negate=True),
+            10.0
+        )
+        self.assertIsNone(table.get_baseline_avg('PEDR_1', 'AOE'))
+
+
+class TestPermutationsTableCsv(ut.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+
+    def write_csv(self, content: str) -> str:
+        csv_path = os.path.join(self.tmp_dir.name, 'permutations.csv')
+        with open(csv_path, 'w') as fp:
+            fp.write(content)
+        return csv_path
+
+
+    def test_empty_csv(self):
+        csv_path = self.write_csv('')
+        with self.assertRaises(ETRMConnectionError):
+            PermutationsTable(csv_path)
+
+
+    def test_invalid_path(self):
+        csv_path = self.write_csv('')
+        invalid_paths = [
+            os.path.join(self.tmp_dir.name, 'missing.csv'),
+            os.path.join(csv_path, 'permutations.csv')
+        ]
+        for invalid_path in invalid_paths:
+            with self.assertRaises(ETRMConnectionError):
+                PermutationsTable(invalid_path)
+
+
+    def test_headers_only_csv(self):
+        csv_path = self.write_csv(','.join(HEADERS) + '\n')
+        table = PermutationsTable(csv_path)
+        self.assertEqual(table.count, 0)
+        self.assertEqual(table.headers, HEADERS)
+
+
+def suite() -> ut.TestSuite:
+    suite = ut.TestSuite()
+    test_cases: list[ut.TestCase] = [
+        TestPermutationsTableJoin,
+        TestPermutationsTableBaselines,
+        TestPermutationsTableCsv
+    ]
+
+    for test_case in test_cases:
+        methods = get_test_methods(test_case)
+        suite.addTests(methods)
+
+    return suite
+
+
+if __name__ == '__main__':
+    runner = ut.TextTestRunner()
+    runner.run(suite())
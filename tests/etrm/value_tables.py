@@ -0,0 +1,106 @@
+import unittest as ut
+from typing import Any
+
+from src.etrm.models import SharedValueTable
+from src.etrm.exceptions import ETRMResponseError
+from tests.utils import get_test_methods
+
+
+def shared_table_json(values: list[list[Any]]) -> dict[str, Any]:
+    return {
+        'name': 'EUL',
+        'api_name': 'EUL',
+        'parameters': ['EUL_ID', 'Sector'],
+        'columns': [
+            {'name': 'EUL', 'api_name': 'EUL_Yrs', 'unit': 'yr',
+             'reference_refs': []},
+            {'name': 'RUL', 'api_name': 'RUL_Yrs', 'unit': 'yr',
+             'reference_refs': []}
+        ],
+        'values': values,
+        'references': [],
+        'version': '01',
+        'status': 'Published',
+        'change_description': '',
+        'owner': '',
+        'is_published': True,
+        'committed_date': '2024-01-01',
+        'last_updated_date': '2024-01-01',
+        'type': 'shared_value_table',
+        'versions_url': '',
+        'url': ''
+    }
+
+
+class TestSharedValueTable(ut.TestCase):
+    def test_data(self):
+        table = SharedValueTable(shared_table_json([
+            ['E1', 'Res', 10, 5],
+            ['E2', 'Com', 12, None],
+            ['E1', 'Com', 11, 6]
+        ]))
+        self.assertEqual(
+            table.data,
+            {
+                'E1': {
+                    'Sector': ['Res', 'Com'],
+                    'EUL_Yrs': [10, 11],
+                    'RUL_Yrs': [5, 6]
+                },
+                'E2': {
+                    'Sector': ['Com'],
+                    'EUL_Yrs': [12],
+                    'RUL_Yrs': [None]
+                }
+            }
+        )
+
+
+    def test_ragged_rows(self):
+        table = SharedValueTable(shared_table_json([
+            ['E1', 'Res', 10, 5],
+            ['E1', 'Com'],
+            ['E2']
+        ]))
+        self.assertEqual(
+            table.data,
+            {
+                'E1': {
+                    'Sector': ['Res', 'Com'],
+                    'EUL_Yrs': [10],
+                    'RUL_Yrs': [5]
+                },
+                'E2': {}
+            }
+        )
+
+
+    def test_malformed_rows(self):
+        with self.assertRaises(ETRMResponseError):
+            SharedValueTable(shared_table_json([[]]))
+
+        with self.assertRaises(ETRMResponseError):
+            SharedValueTable(shared_table_json([['E1', 'Res', 10, 5, 1]]))
+
+
+    def test_no_values(self):
+        table = SharedValueTable(shared_table_json([]))
+        self.assertEqual(table.data, {})
+
+
+def suite() -> ut.TestSuite:
+    suite = ut.TestSuite()
+    test_cases: list[ut.TestCase] = [
+        TestSharedValueTable
+    ]
+
+    for test_case in test_cases:
+        methods = get_test_methods(test_case)
+        suite.addTests(methods)
+
+    return suite
+
+
+if __name__ == '__main__':
+    runner = ut.TextTestRunner()
+    runner.run(suite())
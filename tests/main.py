@@ -2,12 +2,13 @@ import sys
 import os
 import unittest as ut
 
-from tests import permqaqc, parser
+from tests import permqaqc, parser, etrm
 
 
 MODULES = {
     'permqaqc': permqaqc.suites,
-    'parser': parser.suites
+    'parser': parser.suites,
+    'etrm': etrm.suites
 }
 
 